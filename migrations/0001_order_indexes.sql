@@ -0,0 +1,4 @@
+-- Indexes for order lookups by user and the product → orders direction.
+-- New databases get these from db.create_all(); run this on existing ones.
+CREATE INDEX ix_orders_user_id_id ON orders (user_id, id);
+CREATE INDEX ix_order_product_product ON order_product (product_id, order_id);
@@ -0,0 +1,3 @@
+-- The composite primary key (order_id, product_id) already enforces
+-- uniqueness; the extra unique index only adds write cost.
+ALTER TABLE order_product DROP INDEX uix_order_product;
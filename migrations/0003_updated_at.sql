@@ -0,0 +1,14 @@
+-- Row versions used for ETag / If-None-Match on GET endpoints.
+-- The app writes datetime.utcnow(), so backfill with UTC_TIMESTAMP (not the
+-- server-local CURRENT_TIMESTAMP) and leave no column default behind.
+ALTER TABLE users ADD COLUMN updated_at DATETIME(6) NULL;
+ALTER TABLE products ADD COLUMN updated_at DATETIME(6) NULL;
+ALTER TABLE orders ADD COLUMN updated_at DATETIME(6) NULL;
+
+UPDATE users SET updated_at = UTC_TIMESTAMP(6);
+UPDATE products SET updated_at = UTC_TIMESTAMP(6);
+UPDATE orders SET updated_at = UTC_TIMESTAMP(6);
+
+ALTER TABLE users MODIFY updated_at DATETIME(6) NOT NULL;
+ALTER TABLE products MODIFY updated_at DATETIME(6) NOT NULL;
+ALTER TABLE orders MODIFY updated_at DATETIME(6) NOT NULL;
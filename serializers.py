@@ -0,0 +1,33 @@
+"""
+Response dict builders for the read path.
+
+Kept in their own module, free of Flask/SQLAlchemy imports, so they can be
+compiled with mypyc (``mypyc serializers.py``). A compiled extension sitting
+next to this file is picked up by ``import serializers`` automatically; without
+it the plain Python module is used. Keys mirror the Marshmallow schema order.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+def user_to_dict(u: Any) -> Dict[str, Any]:
+    return {"id": u.id, "name": u.name, "address": u.address, "email": u.email}
+
+
+def product_to_dict(p: Any) -> Dict[str, Any]:
+    return {"id": p.id, "product_name": p.product_name, "price": p.price}
+
+
+def dump_products(o: Any) -> List[Dict[str, Any]]:
+    return [product_to_dict(p) for p in o.products]
+
+
+def order_to_dict(o: Any) -> Dict[str, Any]:
+    # order_date stays a datetime; orjson emits naive datetimes as ISO 8601
+    return {
+        "id": o.id,
+        "user_id": o.user_id,
+        "order_date": o.order_date,
+        "products": dump_products(o),
+    }